@@ -97,6 +97,7 @@ def startup(app_name, app_version, argv):
     cuegui.Style.init()
 
     mainWindow = cuegui.MainWindow.MainWindow(app_name, app_version,  None)
+    mainWindow.Initialize()
     mainWindow.displayStartupNotice()
     mainWindow.show()
 
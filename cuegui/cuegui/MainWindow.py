@@ -27,6 +27,7 @@ from builtins import str
 from builtins import range
 import sys
 import time
+import weakref
 
 from PySide2 import QtCore
 from PySide2 import QtGui
@@ -42,11 +43,16 @@ import cuegui.Utils
 
 logger = cuegui.Logger.getLogger(__file__)
 
+# Window names per application, built once and shared by all MainWindow
+# instances of the same application
+_WINDOWS_NAMES_CACHE = {}
+
 
 class MainWindow(QtWidgets.QMainWindow):
     """The main window of the application. Multiple windows may exist."""
 
-    windows = []
+    windows = weakref.WeakSet()
+    windows_by_name = {}
     windows_names = []
     windows_titles = {}
     windows_actions = {}
@@ -55,15 +61,29 @@ class MainWindow(QtWidgets.QMainWindow):
         QtWidgets.QMainWindow.__init__(self, parent)
 
         self.__actions_facility = {}
+        self.__action_to_facility = {}
+        self.__checked_facility = None
         self.facility_default = None
         self.facility_dict = None
+        self.fileMenu = None
+        self.facilityMenu = None
+        self.PluginMenu = None
         self.windowMenu = None
+        self.helpMenu = None
+        self.__plugins = None
+        self.__saved_state = None
+        self._initialized = False
+        self._state_restored = False
 
         self.qApp = QtGui.qApp
         # pylint: disable=no-member
         self.settings = QtGui.qApp.settings
         # pylint: enable=no-member
-        self.windows_names = [app_name] + ["%s_%s" % (app_name, num) for num in range(2, 5)]
+        names = _WINDOWS_NAMES_CACHE.get(app_name)
+        if names is None:
+            names = tuple([app_name] + ["%s_%s" % (app_name, num) for num in range(2, 5)])
+            _WINDOWS_NAMES_CACHE[app_name] = names
+        self.windows_names = names
         self.app_name = app_name
         self.app_version = app_version
         if window_name:
@@ -71,6 +91,10 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             self.name = self.windows_names[0]
 
+        # Settings keys for this window, built once for reuse in hot paths
+        self.__key_title = "%s/Title" % self.name
+        self.__key_open = "%s/Open" % self.name
+
         # Provides a location for widgets to the right of the menu
         menuLayout = QtWidgets.QHBoxLayout()
         menuLayout.addStretch()
@@ -84,6 +108,16 @@ class MainWindow(QtWidgets.QMainWindow):
         # Register this window
         self.__windowOpened()
 
+    def Initialize(self):
+        """Performs the expensive portion of window setup.
+
+        Menus, plugins and saved window state are built here rather than in
+        __init__ so that callers can defer the work until just before the
+        window is shown."""
+        if self._initialized:
+            return
+        self._initialized = True
+
         # Create menus
         self.__createMenus()
 
@@ -148,6 +182,7 @@ class MainWindow(QtWidgets.QMainWindow):
         @return: The QMenu that the actions were added to
         @rtype:  QMenu"""
         self.__actions_facility = {}
+        self.__action_to_facility = {}
         menu.setFont(cuegui.Constants.STANDARD_FONT)
         menu.triggered.connect(self.__facilityMenuHandle)
 
@@ -156,38 +191,35 @@ class MainWindow(QtWidgets.QMainWindow):
         self.facility_dict = cue_config.get("cuebot.facility")
 
         for facility in self.facility_dict:
-            self.__actions_facility[facility] = QtWidgets.QAction(facility, menu)
-            self.__actions_facility[facility].setCheckable(True)
-            menu.addAction(self.__actions_facility[facility])
+            action = QtWidgets.QAction(facility, menu)
+            action.setCheckable(True)
+            self.__actions_facility[facility] = action
+            self.__action_to_facility[action] = facility
+            menu.addAction(action)
 
         self.__actions_facility[self.facility_default].setChecked(True)
+        self.__checked_facility = self.facility_default
         return menu
 
     def __facilityMenuHandle(self, action):
         """Called when a facility menu item is clicked on.
         @param action: Menu QAction
         @type  action: QAction"""
-        # If all cues are unchecked, check default one
+        facility = self.__action_to_facility[action]
+
+        # Unchecking the active facility reverts to the default one
         if not action.isChecked():
-            checked = False
-            for facility in list(self.__actions_facility.values()):
-                if facility.isChecked():
-                    checked = True
-            if not checked:
-                self.__actions_facility[self.facility_default].setChecked(True)
-        # Uncheck all other facilities if one is checked
-        else:
-            for facility in self.__actions_facility:
-                if facility != action.text():
-                    self.__actions_facility[facility].setChecked(False)
-
-        for facility in list(self.__actions_facility.values()):
-            if facility.isChecked():
-                opencue.Cuebot.setFacility(str(facility.text()))
-                # pylint: disable=no-member
-                QtGui.qApp.facility_changed.emit()
-                # pylint: enable=no-member
-                return
+            facility = self.facility_default
+            self.__actions_facility[facility].setChecked(True)
+        # Uncheck the previously checked facility
+        elif facility != self.__checked_facility:
+            self.__actions_facility[self.__checked_facility].setChecked(False)
+
+        self.__checked_facility = facility
+        opencue.Cuebot.setFacility(facility)
+        # pylint: disable=no-member
+        QtGui.qApp.facility_changed.emit()
+        # pylint: enable=no-member
 
     ################################################################################
 
@@ -270,10 +302,11 @@ class MainWindow(QtWidgets.QMainWindow):
 
         menu.addSeparator()
 
-        # Load list of window titles
+        # Load list of window titles, cached as the single source of truth so
+        # menu updates do not have to re-read the settings backend
         if not self.windows_titles:
             for name in self.windows_names:
-                self.windows_titles[name] = str(self.settings.value("%s/Title" % name, name))
+                self.windows_titles[name] = self.settings.value("%s/Title" % name, "")
 
         # Create menu items for Window -> Open/Raise/Add Window "?"
         for name in self.windows_names:
@@ -287,81 +320,89 @@ class MainWindow(QtWidgets.QMainWindow):
         self.__windowMenuUpdate()
 
     def __windowMenuUpdate(self):
-        """Updates the QAction for each main window"""
-        number = 1
+        """Updates the QAction of every main window"""
         for name in self.windows_names:
-            title = self.settings.value("%s/Title" % name, "")
-            if title:
-                title = "Open Window: %s" % self.windows_titles[name]
-            else:
-                title = "(%s) Add new window" % number
-            self.windows_actions[name].setText(title)
-            number += 1
-
-        # Rename all the window menu actions to the window title
-        for window in self.windows:
-            self.windows_actions[window.name].setText("Raise Window: %s" % window.windowTitle())
+            self.__windowMenuUpdateAction(name)
+
+    def __windowMenuUpdateAction(self, name):
+        """Updates the QAction for a single main window
+        @param name: The name of the window the action belongs to
+        @type  name: str"""
+        action = self.windows_actions.get(name)
+        if action is None:
+            return
+
+        # Point the menu action for an open window at the window itself
+        window = self.windows_by_name.get(name)
+        if window is not None:
+            action.setText("Raise Window: %s" % window.windowTitle())
+            action.setData(("raise", name))
+            return
+
+        title = self.windows_titles.get(name, "")
+        if title:
+            title = "Open Window: %s" % title
+        else:
+            title = "(%s) Add new window" % (self.windows_names.index(name) + 1)
+        action.setText(title)
+        action.setData(("open", name))
 
     def __windowMenuHandle(self, action):
         """Handles the proper action for when a main window's QAction is clicked"""
-        action_title = str(action.text())
-        if action_title.startswith("Open Window: "):
-            window_title = action_title.replace("Open Window: ","")
-            for name in self.windows_titles:
-                if self.windows_titles[name] == window_title:
-                    self.windowMenuOpenWindow(name)
-
-        elif action_title.endswith("Add new window") and len(action_title) == 18:
-            number = int(action_title[1:].split(")")[0]) - 1
-            self.windowMenuOpenWindow(self.windows_names[number])
-
-        elif action_title.startswith("Raise Window: "):
-            for window in self.windows:
-                if str(window.windowTitle()) == action_title.replace("Raise Window: ",""):
-                    window.raise_()
-                    return
+        data = action.data()
+        if not data:
+            return
+        mode, target = data
+        if mode == "open":
+            self.windowMenuOpenWindow(target)
+        elif mode == "raise":
+            window = self.windows_by_name.get(target)
+            if window is not None:
+                window.raise_()
 
     def __windowMenuHandleChangeTitle(self):
         """Changes the title of the current window"""
         # Change the title of the current window
         (value, choice) = QtWidgets.QInputDialog.getText(
             self, "Rename window","Please provide a title for the window",
-            QtWidgets.QLineEdit.Normal, str(self.windowTitle()))
+            QtWidgets.QLineEdit.Normal, self.windowTitle())
         if choice:
             # Don't allow the same name twice
             for window in self.windows:
-                if window.name == str(value) or str(window.windowTitle()) == str(value):
+                if window.name == value or window.windowTitle() == value:
                     return
-            self.setWindowTitle(str(value))
-            self.windows_titles[self.name] = str(value)
+            self.setWindowTitle(value)
+            self.windows_titles[self.name] = value
 
         # Save the new title to settings
-        self.settings.setValue("%s/Title" % self.name, self.windowTitle())
+        self.settings.setValue(self.__key_title, self.windowTitle())
 
-        self.__windowMenuUpdate()
+        self.__windowMenuUpdateAction(self.name)
 
     def windowMenuOpenWindow(self, name):
         """Launches the desired window"""
         # Don't open the same window twice
-        for window in self.windows:
-            if window.name == name or str(window.windowTitle()) == name:
-                window.raise_()
-                return
+        window = self.windows_by_name.get(name)
+        if window is not None:
+            window.raise_()
+            return
 
         # Create the new window
         mainWindow = MainWindow(self.app_name, self.app_version, name)
-        if str(mainWindow.windowTitle()) == self.app_name:
+        mainWindow.Initialize()
+        if mainWindow.windowTitle() == self.app_name:
             mainWindow.setWindowTitle(name)
         mainWindow.show()
         mainWindow.raise_()
 
-        self.__windowMenuUpdate()
+        self.__windowMenuUpdateAction(name)
 
     def __windowOpened(self):
         """Called from __init__ on window creation"""
         # pylint: disable=no-member
-        self.qApp.quit.connect(self.close)
-        self.windows.append(self)
+        self.qApp.quit.connect(self.close, QtCore.Qt.UniqueConnection)
+        self.windows.add(self)
+        self.windows_by_name[self.name] = self
         self.qApp.closingApp = False
         # pylint: enable=no-member
 
@@ -369,21 +410,21 @@ class MainWindow(QtWidgets.QMainWindow):
         """Called from closeEvent on window close"""
 
         # Disconnect to avoid multiple attempts to close a window
-        # pylint: disable=no-member
-        self.qApp.quit.connect(self.close)
-        # pylint: enable=no-member
+        try:
+            # pylint: disable=no-member
+            self.qApp.quit.disconnect(self.close)
+            # pylint: enable=no-member
+        except RuntimeError:
+            pass
 
         # Save the fact that this window is open or not when the app closed
         # pylint: disable=no-member
-        self.settings.setValue("%s/Open" % self.name, self.qApp.closingApp)
+        self.settings.setValue(self.__key_open, self.qApp.closingApp)
         # pylint: enable=no-member
 
-        # pylint: disable=bare-except
-        try:
-            self.windows.remove(self)
-        except:
-            pass
-        self.__windowMenuUpdate()
+        self.windows.discard(self)
+        self.windows_by_name.pop(self.name, None)
+        self.__windowMenuUpdateAction(self.name)
 
     def __windowCloseWindow(self):
         """Closes the current window"""
@@ -430,21 +471,44 @@ class MainWindow(QtWidgets.QMainWindow):
         @type  event: QEvent
         @param event: The close event"""
         del event
-        self.__saveSettings()
+        # A window that was never initialized has no plugins and no state
+        # worth saving; writing its settings would clobber the saved
+        # geometry with a never-shown default-size window
+        if self._initialized:
+            self.__saveSettings()
         self.__windowClosed()
 
     def __restoreSettings(self):
         """Restores the windows settings"""
-        self.__plugins.restoreState()
-
-        self.setWindowTitle(self.settings.value("%s/Title" % self.name,
-                                                self.app_name))
-        self.restoreState(self.settings.value("%s/State" % self.name,
-                                              QtCore.QByteArray()))
-        self.resize(self.settings.value("%s/Size" % self.name,
-                                        QtCore.QSize(1280, 1024)))
-        self.move(self.settings.value("%s/Position" % self.name,
-                                      QtCore.QPoint(0, 0)))
+        self.settings.beginGroup(self.name)
+        self.setWindowTitle(self.settings.value("Title", self.app_name))
+        self.__saved_state = self.settings.value("State", QtCore.QByteArray())
+        if self.settings.contains("Size"):
+            self.resize(self.settings.value("Size"))
+        else:
+            self.resize(QtCore.QSize(1280, 1024))
+        if self.settings.contains("Position"):
+            self.move(self.settings.value("Position"))
+        self.settings.endGroup()
+
+        # Defer plugin restoration to the event loop so the window can paint
+        # before the plugin widgets are constructed and wired up.
+        QtCore.QTimer.singleShot(0, self.__restorePlugins)
+
+    def __restorePlugins(self):
+        """Restores the plugins, then applies the saved window state."""
+        self.__plugins.restoreState(self.__restoreWindowState)
+
+    def __restoreWindowState(self):
+        """Applies the saved dock-widget state.
+
+        QMainWindow.restoreState() only affects dock widgets that already
+        exist, so this must run after every queued plugin has been launched.
+        The layout pass is skipped when there is no saved state, such as on
+        a first-ever launch."""
+        if not self.__saved_state.isEmpty():
+            self.restoreState(self.__saved_state)
+        self._state_restored = True
 
     def __saveSettings(self):
         """Saves the windows settings"""
@@ -456,14 +520,23 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.settings.setValue("Version", self.app_version)
 
-        self.settings.setValue("%s/Title" % self.name,
-                               self.windowTitle())
-        self.settings.setValue("%s/State" % self.name,
-                               self.saveState())
-        self.settings.setValue("%s/Size" % self.name,
-                               self.size())
-        self.settings.setValue("%s/Position" % self.name,
-                               self.pos())
+        self.windows_titles[self.name] = self.windowTitle()
+
+        self.settings.beginGroup(self.name)
+        self.settings.setValue("Title", self.windowTitle())
+        # Until the deferred plugin restore has applied the saved dock
+        # layout, the live state is empty or partial; write back the saved
+        # value so an early save cannot clobber the user's layout
+        if self._state_restored:
+            self.settings.setValue("State", self.saveState())
+        elif self.__saved_state is not None:
+            self.settings.setValue("State", self.__saved_state)
+        self.settings.setValue("Size", self.size())
+        self.settings.setValue("Position", self.pos())
+        self.settings.endGroup()
+
+        # Flush all of the above to disk in a single write
+        self.settings.sync()
 
     def __revertLayout(self):
         """Revert back to default window layout"""
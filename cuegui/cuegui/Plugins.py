@@ -76,6 +76,9 @@ SETTINGS_KEY = 0
 SETTINGS_GET = 1
 SETTINGS_SET = 2
 
+# Number of queued plugins to launch per event loop tick when restoring state
+LAUNCH_CHUNK_SIZE = 2
+
 try:
     JSON_EXCEPTION_CLASS = json.decoder.JSONDecodeError
 except AttributeError:
@@ -96,6 +99,9 @@ class Plugins(object):
         @param name: Name of current window
         @type  name: string"""
         self.__running = []
+        self._pendingLaunches = []
+        self._onRestoreComplete = None
+        self._restored = False
         self.name = name
         self.mainWindow = mainWindow
 
@@ -173,6 +179,10 @@ class Plugins(object):
         """Saves the names of all open plugins.
 
         Calls .saveSettings (if available) on all plugins."""
+        if not self._restored:
+            # restoreState() has not run yet; overwriting the saved list now
+            # would discard the user's session
+            return
         opened = []
         for plugin in self.__running:
             # pylint: disable=broad-except
@@ -181,14 +191,26 @@ class Plugins(object):
                     opened.append("%s::%s" % (plugin[0], json.dumps(plugin[1].pluginSaveState())))
             except Exception as e:
                 logger.warning("Error saving plugin state for: %s\n%s", plugin[0], e)
+        # Plugins still queued for launch have not run yet; carry their last
+        # saved state through so closing before the queue drains does not
+        # drop them from the session
+        for plugin_name, plugin_state in self._pendingLaunches:
+            opened.append("%s::%s" % (plugin_name, plugin_state))
         # pylint: disable=no-member
         QtGui.qApp.settings.setValue("%s/Plugins_Opened" % self.name, opened)
         # pylint: enable=no-member
 
-    def restoreState(self):
+    def restoreState(self, on_complete=None):
         """Loads any user defined plugin directories and restores all open plugins.
 
-        Calls .restoreSettings (if available) on all plugins."""
+        Calls .restoreSettings (if available) on all plugins.
+
+        @param on_complete: Optional callable invoked once every queued plugin
+                            has been launched
+        @type  on_complete: callable"""
+        self._onRestoreComplete = on_complete
+        self._restored = True
+
         # Loads any user defined plugin directories
         # pylint: disable=no-member
         pluginPaths = QtGui.qApp.settings.value("Plugins/Paths", [])
@@ -197,14 +219,37 @@ class Plugins(object):
         for path in pluginPaths:
             self.loadPluginPath(str(path))
 
-        # Runs any plugins that were saved to the settings
+        # Queues any plugins that were saved to the settings; they are
+        # launched in chunks from the event loop to keep the UI responsive.
         # pylint: disable=no-member
         openPlugins = QtGui.qApp.settings.value("%s/Plugins_Opened" % self.name) or []
         # pylint: enable=no-member
         for plugin in openPlugins:
             if '::' in plugin:
                 plugin_name, plugin_state = str(plugin).split("::")
-                self.launchPlugin(plugin_name, plugin_state)
+                self._pendingLaunches.append((plugin_name, plugin_state))
+        if self._pendingLaunches:
+            QtCore.QTimer.singleShot(0, self._drainPendingLaunches)
+        else:
+            self._restoreComplete()
+
+    def _drainPendingLaunches(self):
+        """Launches a chunk of queued plugins, rescheduling itself until the
+        queue is empty."""
+        for plugin_name, plugin_state in self._pendingLaunches[:LAUNCH_CHUNK_SIZE]:
+            self.launchPlugin(plugin_name, plugin_state)
+        del self._pendingLaunches[:LAUNCH_CHUNK_SIZE]
+        if self._pendingLaunches:
+            QtCore.QTimer.singleShot(0, self._drainPendingLaunches)
+        else:
+            self._restoreComplete()
+
+    def _restoreComplete(self):
+        """Invokes the restoreState completion callback, if one was given."""
+        if self._onRestoreComplete is not None:
+            callback = self._onRestoreComplete
+            self._onRestoreComplete = None
+            callback()
 
     def launchPlugin(self, plugin_name, plugin_state):
         """Launches the desired plugin.